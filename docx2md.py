@@ -7,16 +7,37 @@ embedded media and optionally adding YAML front matter from document properties.
 Prefers Pandoc for conversion but falls back to Mammoth+Markdownify if unavailable.
 """
 
+import base64
+import contextlib
+import errno
+import functools
+import hashlib
+import json
 import logging
+import logging.handlers
+import mimetypes
+import mmap
+import multiprocessing
+import os
 import re
 import shutil
+import socket
 import subprocess
 import sys
 import tempfile
+import time
+import urllib.request
 import zipfile
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-from xml.etree import ElementTree as ET
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from xml.etree import ElementTree
 
 import click
 import mammoth
@@ -34,6 +55,13 @@ from rich.progress import (
 from rich.table import Table
 from rich.text import Text
 
+# lxml is an optional extra that speeds up XML parsing; the standard library
+# parser is used when it is not installed
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
 # Initialize Rich console
 console = Console()
 
@@ -45,6 +73,452 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Batches larger than this skip the live progress bar
+PROGRESS_BAR_FILE_LIMIT = 1000
+# Files between status lines when the progress bar is disabled
+PLAIN_PROGRESS_INTERVAL = 100
+# Files between progress bar description updates
+PROGRESS_DESCRIPTION_INTERVAL = 32
+# Most files converted by one worker task
+WORKER_CHUNK_SIZE = 32
+# Write buffer for Markdown output files
+OUTPUT_BUFFER_SIZE = 1 << 20
+# Seconds a single conversion may take on the shared Pandoc server
+PANDOC_SERVER_TIMEOUT = 120
+
+# Errors raised by whichever XML parser is in use
+_XML_ERRORS: Tuple[type, ...] = (ElementTree.ParseError,)
+if lxml_etree is not None:
+    _XML_ERRORS += (lxml_etree.XMLSyntaxError,)
+
+# Precompiled regular expressions used on every converted document
+# Generic title patterns, dispatched on the first character of the title
+_REPORT_TITLE_RE = re.compile(r"report\s*v?\d*\.?\d*$")
+_DOCUMENT_TITLE_RE = re.compile(r"document\s*v?\d*\.?\d*$")
+_NEW_DOCUMENT_TITLE_RE = re.compile(r"new\s+document")
+_TOC_RE = re.compile(r"\[([^\]\n]+)\]\(#_Toc\d+\)")
+_HEADING_LINE_RE = re.compile(r"^[^\S\n]*(#[^\n]*)", re.MULTILINE)
+_ANCHOR_NONWORD_RE = re.compile(r"[^\w\s-]")
+_ANCHOR_DASH_RE = re.compile(r"[-\s]+")
+_MULTI_BLANK_RE = re.compile(r"\n\s*\n\s*\n+")
+
+# A list item line: optional indentation, a marker and a space followed by
+# more text. [^\S\n] is whitespace within a line, the same characters
+# str.strip() removes, so line kinds match those of the stripped lines.
+_LIST_LINE = r"[^\S\n]*+(?:[-*+]|\d++[.)]) (?=[^\n]*\S)"
+_LIST_LINE_RE = re.compile(_LIST_LINE)
+# MD022/MD032: each alternative matches a line plus its newline when a blank
+# line must follow it before the next line
+_BLANK_LINE_NEEDED_RE = re.compile(
+    # A heading followed by a list item or text
+    r"^[^\S\n]*+#[^\n]*+\n(?=[^\S\n]*+[^\s#])"
+    # Text followed by a heading or a list item
+    rf"|^(?!{_LIST_LINE})[^\S\n]*+[^\s#][^\n]*+\n(?=[^\S\n]*+#|{_LIST_LINE})"
+    # The end of a list, including blank lines inside it, followed by a
+    # heading or text
+    rf"|^{_LIST_LINE}[^\n]*+(?:\n[^\S\n]*+$)*+\n(?=(?!{_LIST_LINE})[^\S\n]*+\S)",
+    re.MULTILINE,
+)
+_NUM_TAIL_RE = re.compile(r"\s+\d+$")
+_NUM_LEAD_RE = re.compile(r"^\d+\.?\s*")
+# A "1." section number, with its indentation, at the start of a line
+# followed by bold text
+_SECTION_ONE_RE = re.compile(r"^[^\S\n]*1\.(?=[^\S\n]*\*\*)", re.MULTILINE)
+
+# Filename sanitizing: spaces become underscores, invalid characters go
+_SANITIZE_TABLE = str.maketrans({" ": "_", **dict.fromkeys('<>:"/\\|?*')})
+
+# Markdown formatting characters dropped from heading anchors
+_ANCHOR_MARKUP_TABLE = str.maketrans("", "", "#*_`")
+# Formatting plus every ASCII character _ANCHOR_NONWORD_RE would remove, so
+# ASCII headings are slugged with one C-level pass instead of the regex
+_ANCHOR_STRIP_TABLE = str.maketrans(
+    "",
+    "",
+    "#*_`"
+    + "".join(
+        chr(code)
+        for code in range(128)
+        if chr(code) != "-" and _ANCHOR_NONWORD_RE.match(chr(code))
+    ),
+)
+
+# Skip reasons for files picked up by discovery, checked in order
+_SKIP_PREFIX_REASONS = {
+    "~$": "Word temporary/lock file",
+    ".~lock.": "LibreOffice lock file",
+    ".": "hidden file",
+}
+# Word temporary (~$), LibreOffice lock (.~lock.) and hidden files
+_TEMP_FILE_PREFIXES = ("~$", ".")
+_SKIP_SUFFIX_REASONS = {
+    ".doc": "unsupported format (.doc/.docm)",
+    ".docm": "unsupported format (.doc/.docm)",
+}
+
+# Phrases that mark a bold line as body text rather than a document title
+_BODY_TEXT_WORDS = frozenset(
+    ["innehållsförteckning", "table of contents", "inledning", "introduction"]
+)
+
+# Namespace mappings used in docProps/core.xml
+_CORE_NAMESPACES = {
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "dcterms": "http://purl.org/dc/terms/",
+    "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
+}
+
+# Qualified core.xml element tags and the property each one fills
+_CORE_PROPERTY_TAGS = {
+    f"{{{_CORE_NAMESPACES['dc']}}}title": "title",
+    f"{{{_CORE_NAMESPACES['dc']}}}creator": "author",
+    f"{{{_CORE_NAMESPACES['dcterms']}}}created": "created",
+    f"{{{_CORE_NAMESPACES['dcterms']}}}modified": "modified",
+}
+
+
+def _open_local(request, timeout: float):
+    """Open a URL on the local Pandoc server, ignoring any configured proxy.
+
+    urlopen() honours HTTP_PROXY even for 127.0.0.1 unless NO_PROXY lists
+    it, which would send every document through the proxy.
+    """
+    opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+    return opener.open(request, timeout=timeout)
+
+
+class PandocServer:
+    """A ``pandoc server`` process shared by all conversions in a batch."""
+
+    def __init__(self, process: subprocess.Popen, port: int):
+        self.process = process
+        self.url = f"http://127.0.0.1:{port}/"
+
+    @classmethod
+    def start(
+        cls, pandoc: Path, startup_timeout: float = 2.0
+    ) -> Optional["PandocServer"]:
+        """Start a Pandoc server on a free local port, or return None if unavailable."""
+        # Ask the OS for a free port, then hand it to Pandoc
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        # A standalone pandoc-server binary is the server itself, while the
+        # regular pandoc binary needs the server subcommand
+        # Pandoc's default per-request timeout is 2 seconds, far shorter than
+        # a large document takes; match the client timeout instead
+        cmd = [
+            str(pandoc),
+            "--port",
+            str(port),
+            "--timeout",
+            str(PANDOC_SERVER_TIMEOUT),
+        ]
+        if pandoc.stem.lower() != "pandoc-server":
+            cmd.insert(1, "server")
+
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            logger.debug(f"Could not start pandoc server: {e}")
+            return None
+
+        server = cls(process, port)
+        deadline = time.monotonic() + startup_timeout
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                logger.debug("Pandoc server exited during startup")
+                return None
+            try:
+                with _open_local(f"{server.url}version", timeout=0.5):
+                    logger.debug(f"Started pandoc server at {server.url}")
+                    return server
+            except OSError:
+                time.sleep(0.05)
+
+        logger.debug("Pandoc server did not become ready in time")
+        server.close()
+        return None
+
+    def close(self):
+        """Stop the server process."""
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+
+def _request_pandoc_server(
+    url: str, docx_path: Path, timeout: float = PANDOC_SERVER_TIMEOUT
+) -> str:
+    """Convert a DOCX file to GitHub Flavored Markdown through a Pandoc server."""
+    payload = {
+        # Binary input formats are sent base64-encoded
+        "text": base64.b64encode(docx_path.read_bytes()).decode("ascii"),
+        "from": "docx",
+        "to": "gfm",
+        "wrap": "auto",
+    }
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json", "Accept": "application/json"},
+    )
+    with _open_local(request, timeout=timeout) as response:
+        result = json.loads(response.read().decode("utf-8"))
+
+    for message in result.get("messages", []):
+        logger.debug(f"Pandoc server message: {message}")
+
+    output = result["output"]
+    if result.get("base64"):
+        output = base64.b64decode(output).decode("utf-8")
+    return output
+
+
+def _iterparse_tags(source, tags: Tuple[str, ...]) -> Iterator[Any]:
+    """Yield each element with one of the given qualified tags as it ends."""
+    if lxml_etree is not None:
+        for _, elem in lxml_etree.iterparse(
+            source,
+            events=("end",),
+            tag=tags,
+            huge_tree=False,
+            collect_ids=False,
+            resolve_entities=False,
+        ):
+            yield elem
+    else:
+        for _, elem in ElementTree.iterparse(source, events=("end",)):
+            if elem.tag in tags:
+                yield elem
+
+
+@functools.lru_cache(maxsize=1)
+def _locate_pandoc(pandoc_path: Optional[Path]) -> Optional[Path]:
+    """Look up the Pandoc executable, caching the result (including a miss)."""
+    if pandoc_path:
+        if pandoc_path.exists():
+            return pandoc_path
+        else:
+            logger.warning(f"Specified pandoc path not found: {pandoc_path}")
+            return None
+
+    # Try to find pandoc in PATH
+    pandoc_cmd = shutil.which("pandoc")
+    if pandoc_cmd:
+        return Path(pandoc_cmd)
+
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize_filename(name: str) -> str:
+    """Sanitize filename: spaces to underscores, preserve case."""
+    # Replace spaces and remove invalid filename characters in one pass
+    return name.translate(_SANITIZE_TABLE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _heading_anchor(heading_text: str) -> str:
+    """Create a proper markdown anchor from heading text."""
+    if heading_text.isascii():
+        # Drop formatting and punctuation in one pass, then lowercase
+        anchor = heading_text.translate(_ANCHOR_STRIP_TABLE).lower()
+    else:
+        # Unicode lowercasing depends on neighbouring characters (final
+        # sigma), so lowercase before removing symbols and punctuation
+        clean_text = heading_text.translate(_ANCHOR_MARKUP_TABLE).strip()
+        anchor = _ANCHOR_NONWORD_RE.sub("", clean_text.lower())
+
+    # Replace runs of spaces and hyphens with one hyphen, trimmed at the ends
+    return _ANCHOR_DASH_RE.sub("-", anchor).strip("-")
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_generic_title(title: str) -> bool:
+    """Check a non-empty title against the generic title patterns."""
+    normalized = title.strip().lower()
+    if not normalized:
+        return True
+
+    # Every pattern starts with a literal word, so at most one regex can apply
+    first = normalized[0]
+    if first == "r":
+        return _REPORT_TITLE_RE.match(normalized) is not None
+    if first == "d":
+        return (
+            normalized.startswith("draft")
+            or _DOCUMENT_TITLE_RE.match(normalized) is not None
+        )
+    if first == "u":
+        return normalized.startswith("untitled")
+    if first == "n":
+        return _NEW_DOCUMENT_TITLE_RE.match(normalized) is not None
+    return False
+
+
+@contextlib.contextmanager
+def _open_docx(docx_path) -> Iterator[Any]:
+    """Open a DOCX for reading, memory-mapped where possible.
+
+    zipfile reads the central directory and each member through the mapping,
+    so only the pages of the members actually decompressed are read in.
+    """
+    with open(docx_path, "rb") as docx_file:
+        mapped = None
+        # zipfile seeks back over the end of central directory record first;
+        # on a shorter file an mmap raises ValueError where a real file
+        # raises OSError (reported as BadZipFile), so read those directly
+        if os.fstat(docx_file.fileno()).st_size >= zipfile.sizeEndCentDir:
+            try:
+                mapped = mmap.mmap(docx_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Some file systems cannot be mapped
+                mapped = None
+
+        if mapped is None:
+            yield docx_file
+            return
+
+        with mapped:
+            yield mapped
+
+
+@functools.lru_cache(maxsize=4096)
+def _inspect_docx_cached(
+    docx_path: str, mtime_ns: int, size: int, read_properties: bool
+) -> Tuple[Dict[str, Any], bool]:
+    """Read a DOCX archive once per (path, mtime, size) version.
+
+    Errors propagate, so unreadable files are not cached and are retried.
+    """
+    with _open_docx(docx_path) as docx_file, zipfile.ZipFile(docx_file) as docx_zip:
+        has_media = any(name.startswith("word/media/") for name in docx_zip.namelist())
+        properties = {}
+        if read_properties:
+            properties = _read_core_properties(docx_zip, docx_path)
+    return properties, has_media
+
+
+def _read_core_properties(docx_zip: zipfile.ZipFile, docx_path: str) -> Dict[str, Any]:
+    """Return the Dublin Core properties from an open DOCX archive."""
+    # Try to read core properties
+    try:
+        core_file = docx_zip.open("docProps/core.xml")
+    except KeyError:
+        logger.debug(f"No core properties found in {docx_path}")
+        return {}
+
+    # Stream the member through the parser, only materializing the four
+    # elements we read. The first occurrence of each element wins, and
+    # nothing is kept unless the whole part parses.
+    found = {}
+    with core_file:
+        for elem in _iterparse_tags(core_file, tuple(_CORE_PROPERTY_TAGS)):
+            key = _CORE_PROPERTY_TAGS[elem.tag]
+            if key not in found:
+                found[key] = elem.text
+            elem.clear()
+
+    return {key: value for key, value in found.items() if value}
+
+
+def _save_media_image(media_base: Path, markdown_dir: Path, image) -> Dict[str, str]:
+    """Write a Mammoth image once per distinct content and return its img attributes.
+
+    The link is relative to markdown_dir, the directory the Markdown file is
+    written to, so it resolves from the file wherever the tree is moved.
+    """
+    with image.open() as image_file:
+        data = image_file.read()
+
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    extension = mimetypes.guess_extension(image.content_type or "") or ".bin"
+    image_path = media_base / f"{digest}{extension}"
+
+    if not image_path.exists():
+        media_base.mkdir(parents=True, exist_ok=True)
+        # Write under a temporary name and rename, so a concurrent worker
+        # saving the same image never sees a partial file
+        with tempfile.NamedTemporaryFile(
+            dir=media_base, prefix=f".{digest}", delete=False
+        ) as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_file.name, image_path)
+
+    try:
+        return {"src": Path(os.path.relpath(image_path, markdown_dir)).as_posix()}
+    except ValueError:
+        # No relative path exists between different Windows drives
+        return {"src": image_path.absolute().as_posix()}
+
+
+def _balanced_chunks(
+    files: List[Tuple[Path, Optional[Path]]],
+    chunk_size: int,
+    sizes: Dict[Path, int],
+) -> List[List[Tuple[Path, Optional[Path]]]]:
+    """Split files into chunks of at most chunk_size, largest documents first.
+
+    Files are sorted by decreasing size and dealt out round-robin, so each
+    chunk holds one of the largest documents rather than the first chunk
+    holding all of them, and chunks come out in order of their largest
+    file so the big documents start first. Files of unknown size count as
+    empty.
+    """
+    ordered = sorted(files, key=lambda item: sizes.get(item[0], 0), reverse=True)
+    chunk_count = -(-len(ordered) // chunk_size)
+    return [ordered[index::chunk_count] for index in range(chunk_count)]
+
+
+def _list_entry_names(directory: Path) -> Set[str]:
+    """Return the names in a directory, or an empty set if it cannot be listed."""
+    try:
+        with os.scandir(directory) as entries:
+            # Symlinks may dangle, so leave them to a real existence check
+            return {entry.name for entry in entries if not entry.is_symlink()}
+    except OSError:
+        return set()
+
+
+def _walk_docx(root: Path, recursive: bool) -> Iterator[os.DirEntry]:
+    """Yield directory entries for .docx files under root."""
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                subdirs = []
+                for entry in entries:
+                    try:
+                        if (
+                            os.path.normcase(entry.name).endswith(".docx")
+                            and entry.is_file()
+                        ):
+                            yield entry
+                        elif (
+                            recursive
+                            # Hidden directories (.git, .obsidian, ...) hold
+                            # tool data rather than documents
+                            and not entry.name.startswith(".")
+                            and entry.is_dir(follow_symlinks=False)
+                        ):
+                            subdirs.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        # Reverse so directories are visited in scandir order
+        stack.extend(reversed(subdirs))
+
 
 class DocxConverter:
     """Main converter class handling DOCX to Markdown conversion."""
@@ -59,6 +533,9 @@ class DocxConverter:
         strict_pure_python: bool = False,
         enable_front_matter: bool = True,
         front_matter_fields: Optional[List[str]] = None,
+        pandoc_server_url: Optional[str] = None,
+        jobs: Optional[int] = None,
+        use_pandoc_server: bool = False,
     ):
         self.output_dir = output_dir
         self.preserve_structure = preserve_structure
@@ -67,6 +544,9 @@ class DocxConverter:
         self.pandoc_path = pandoc_path
         self.strict_pure_python = strict_pure_python
         self.enable_front_matter = enable_front_matter
+        self.pandoc_server_url = pandoc_server_url
+        self.jobs = jobs
+        self.use_pandoc_server = use_pandoc_server
 
         # Default front matter fields if none specified
         if front_matter_fields is None:
@@ -77,84 +557,80 @@ class DocxConverter:
         # Track conversion statistics
         self.stats = {"success": 0, "skipped": 0, "failed": 0}
 
+        # Media parent directories known to hold other documents' media
+        self._nonempty_media_dirs: Set[Path] = set()
+
+        # Sizes of discovered files, used to start the largest ones first
+        self._docx_sizes: Dict[Path, int] = {}
+
+    def worker_config(self) -> Dict[str, Any]:
+        """Return the constructor arguments needed to rebuild this converter in a worker."""
+        return {
+            "output_dir": self.output_dir,
+            "preserve_structure": self.preserve_structure,
+            "overwrite": self.overwrite,
+            "media_dir": self.media_dir,
+            "pandoc_path": self.pandoc_path,
+            "strict_pure_python": self.strict_pure_python,
+            "enable_front_matter": self.enable_front_matter,
+            "front_matter_fields": self.front_matter_fields,
+            "pandoc_server_url": self.pandoc_server_url,
+            "jobs": self.jobs,
+            "use_pandoc_server": self.use_pandoc_server,
+        }
+
     def sanitize_filename(self, name: str) -> str:
         """Sanitize filename: spaces to underscores, preserve case."""
-        # Replace spaces with underscores
-        sanitized = name.replace(" ", "_")
-
-        # Remove or replace invalid filename characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', "", sanitized)
-
-        return sanitized
+        return _sanitize_filename(name)
 
     def find_pandoc(self) -> Optional[Path]:
-        """Find Pandoc executable."""
-        if self.pandoc_path:
-            if self.pandoc_path.exists():
-                return self.pandoc_path
-            else:
-                logger.warning(f"Specified pandoc path not found: {self.pandoc_path}")
-                return None
-
-        # Try to find pandoc in PATH
-        pandoc_cmd = shutil.which("pandoc")
-        if pandoc_cmd:
-            return Path(pandoc_cmd)
-
-        return None
+        """Find Pandoc executable, looked up once per process."""
+        return _locate_pandoc(self.pandoc_path)
 
     def extract_core_properties(self, docx_path: Path) -> Dict[str, Any]:
         """Extract Dublin Core properties from DOCX file."""
-        properties = {}
-
-        try:
-            with zipfile.ZipFile(docx_path, "r") as docx_zip:
-                # Try to read core properties
-                try:
-                    core_xml = docx_zip.read("docProps/core.xml")
-                    root = ET.fromstring(core_xml)
-
-                    # Define namespace mappings
-                    namespaces = {
-                        "dc": "http://purl.org/dc/elements/1.1/",
-                        "dcterms": "http://purl.org/dc/terms/",
-                        "cp": "http://schemas.openxmlformats.org/package/2006/metadata/core-properties",
-                    }
-
-                    # Extract properties
-                    title_elem = root.find(".//dc:title", namespaces)
-                    if title_elem is not None and title_elem.text:
-                        properties["title"] = title_elem.text
-
-                    creator_elem = root.find(".//dc:creator", namespaces)
-                    if creator_elem is not None and creator_elem.text:
-                        properties["author"] = creator_elem.text
+        properties, _ = self.inspect_docx(docx_path)
+        return properties
 
-                    created_elem = root.find(".//dcterms:created", namespaces)
-                    if created_elem is not None and created_elem.text:
-                        properties["created"] = created_elem.text
+    def inspect_docx(
+        self, docx_path: Path, read_properties: bool = True
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Read core properties and detect embedded media with one zip open.
 
-                    modified_elem = root.find(".//dcterms:modified", namespaces)
-                    if modified_elem is not None and modified_elem.text:
-                        properties["modified"] = modified_elem.text
+        Returns (properties, has_media). When the archive cannot be read the
+        document is assumed to have media so the converters handle it fully.
+        """
+        properties = {}
+        has_media = True
 
-                except KeyError:
-                    logger.debug(f"No core properties found in {docx_path}")
+        try:
+            # Unchanged files are answered from the cache without opening them
+            stat = os.stat(docx_path)
+            cached_properties, has_media = _inspect_docx_cached(
+                str(docx_path), stat.st_mtime_ns, stat.st_size, read_properties
+            )
+            # Copy so callers can edit the properties without touching the cache
+            properties.update(cached_properties)
 
-        except (zipfile.BadZipFile, ET.ParseError) as e:
-            logger.warning(f"Could not extract properties from {docx_path}: {e}")
+        except (OSError, zipfile.BadZipFile, *_XML_ERRORS) as e:
+            if read_properties:
+                logger.warning(f"Could not extract properties from {docx_path}: {e}")
 
         # Always add source file
-        properties["source_file"] = docx_path.name
+        if read_properties:
+            properties["source_file"] = docx_path.name
 
-        return properties
+        return properties, has_media
 
     def extract_title_from_markdown(self, md_content: str) -> Optional[str]:
         """Extract title from the first heading in markdown content."""
-        lines = md_content.split("\n")
-
-        for line in lines:
-            line = line.strip()
+        # Walk line by line and stop at the first hit instead of splitting
+        # the whole document up front
+        start = 0
+        length = len(md_content)
+        while start < length:
+            end = md_content.find("\n", start)
+            line = md_content[start : end if end != -1 else length].strip()
             # Look for H1 headings (# Title or **Title**)
             if line.startswith("# "):
                 return line[2:].strip()
@@ -162,16 +638,13 @@ class DocxConverter:
             elif line.startswith("**") and line.endswith("**") and len(line) > 4:
                 potential_title = line[2:-2].strip()
                 # Only consider it a title if it's not too long and doesn't contain common body text indicators
-                if len(potential_title) < 100 and not any(
-                    word in potential_title.lower()
-                    for word in [
-                        "innehållsförteckning",
-                        "table of contents",
-                        "inledning",
-                        "introduction",
-                    ]
-                ):
-                    return potential_title
+                if len(potential_title) < 100:
+                    lowered = potential_title.lower()
+                    if not any(word in lowered for word in _BODY_TEXT_WORDS):
+                        return potential_title
+            if end == -1:
+                break
+            start = end + 1
 
         return None
 
@@ -180,18 +653,7 @@ class DocxConverter:
         if not title:
             return True
 
-        generic_patterns = [
-            r"^report\s*v?\d*\.?\d*$",
-            r"^document\s*v?\d*\.?\d*$",
-            r"^untitled",
-            r"^new\s+document",
-            r"^draft",
-            r"^\s*$",
-        ]
-
-        return any(
-            re.match(pattern, title.strip().lower()) for pattern in generic_patterns
-        )
+        return _is_generic_title(title)
 
     def create_yaml_front_matter(self, properties: Dict[str, Any]) -> str:
         """Create YAML front matter from properties using configured fields."""
@@ -221,58 +683,106 @@ class DocxConverter:
         return "\n".join(lines)
 
     def convert_with_pandoc(
-        self, docx_path: Path, output_path: Path, media_base: Path
-    ) -> bool:
-        """Convert DOCX to Markdown using Pandoc."""
+        self,
+        docx_path: Path,
+        media_base: Path,
+        has_media: bool = True,
+        doc_stem: Optional[str] = None,
+    ) -> Optional[str]:
+        """Convert DOCX to Markdown using Pandoc. Returns the Markdown text."""
         pandoc = self.find_pandoc()
         if not pandoc:
-            return False
+            return None
+
+        # A running Pandoc server avoids starting a new Pandoc process per file.
+        # The server cannot extract media, so documents with images use the CLI.
+        if self.pandoc_server_url and not has_media:
+            try:
+                return _request_pandoc_server(self.pandoc_server_url, docx_path)
+            except Exception as e:
+                logger.debug(f"Pandoc server failed for {docx_path}, using CLI: {e}")
 
         try:
-            # Create media directory for this document
-            doc_stem = self.sanitize_filename(docx_path.stem)
-            media_dir = media_base / doc_stem
-            media_dir.mkdir(parents=True, exist_ok=True)
-
-            # Pandoc command
-            cmd = [
-                str(pandoc),
-                str(docx_path),
-                "-f",
-                "docx",
-                "-t",
-                "gfm",
-                "--wrap=auto",
-                f"--extract-media={media_dir}",
-                "-o",
-                str(output_path),
-            ]
-
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-
-            logger.debug(f"Pandoc output: {result.stdout}")
-            return True
+            # Pandoc writes to a temporary file that is read back once, so the
+            # final Markdown file is only written after post-processing
+            with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as tmp_file:
+                tmp_path = Path(tmp_file.name)
+
+            try:
+                # Pandoc command
+                cmd = [
+                    str(pandoc),
+                    str(docx_path),
+                    "-f",
+                    "docx",
+                    "-t",
+                    "gfm",
+                    "--wrap=auto",
+                    "-o",
+                    str(tmp_path),
+                ]
+
+                # Only ask Pandoc to extract media when the document has any
+                if has_media:
+                    media_dir = media_base / (
+                        doc_stem or self.sanitize_filename(docx_path.stem)
+                    )
+                    media_dir.mkdir(parents=True, exist_ok=True)
+                    cmd.append(f"--extract-media={media_dir}")
+
+                # Pandoc writes the document to the file, so stdout carries
+                # nothing worth buffering; keep stderr for warnings and errors
+                result = subprocess.run(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    check=True,
+                )
+
+                if result.stderr:
+                    logger.debug(f"Pandoc messages: {result.stderr}")
+                return tmp_path.read_text(encoding="utf-8")
+            finally:
+                tmp_path.unlink(missing_ok=True)
 
         except subprocess.CalledProcessError as e:
             logger.error(f"Pandoc failed for {docx_path}: {e.stderr}")
-            return False
+            return None
         except Exception as e:
             logger.error(f"Error running Pandoc for {docx_path}: {e}")
-            return False
+            return None
 
     def convert_with_mammoth(
-        self, docx_path: Path, output_path: Path, media_base: Path
-    ) -> bool:
-        """Convert DOCX to Markdown using Mammoth + Markdownify."""
+        self,
+        docx_path: Path,
+        media_base: Path,
+        has_media: bool = True,
+        markdown_dir: Optional[Path] = None,
+    ) -> Optional[str]:
+        """Convert DOCX to Markdown using Mammoth + Markdownify. Returns the Markdown text.
+
+        Image links are relative to markdown_dir, which defaults to the
+        directory of the DOCX file.
+        """
         try:
-            # Create media directory for this document
-            doc_stem = self.sanitize_filename(docx_path.stem)
-            media_dir = media_base / doc_stem
-            media_dir.mkdir(parents=True, exist_ok=True)
+            # Save images into the shared media directory, named by content
+            # hash so an image repeated across documents is written once
+            options = {}
+            if has_media:
+                options["convert_image"] = mammoth.images.img_element(
+                    functools.partial(
+                        _save_media_image,
+                        media_base,
+                        markdown_dir if markdown_dir is not None else docx_path.parent,
+                    )
+                )
 
-            # Convert DOCX to HTML with Mammoth
-            with open(docx_path, "rb") as docx_file:
-                result = mammoth.convert_to_html(docx_file)
+            # Convert DOCX to HTML with Mammoth. Its own Markdown writer is
+            # deprecated, drops tables and emits __bold__ (which the title and
+            # numbering rules do not recognize), so Markdownify does that step
+            with _open_docx(docx_path) as docx_file:
+                result = mammoth.convert_to_html(docx_file, **options)
                 html = result.value
 
                 if result.messages:
@@ -280,28 +790,18 @@ class DocxConverter:
                         logger.debug(f"Mammoth message: {message}")
 
             # Convert HTML to Markdown
-            markdown = markdownify(html, heading_style="ATX")
-
-            # Save to file
-            with open(output_path, "w", encoding="utf-8") as md_file:
-                md_file.write(markdown)
-
-            return True
+            return markdownify(html, heading_style="ATX")
 
         except Exception as e:
             logger.error(f"Mammoth conversion failed for {docx_path}: {e}")
-            return False
+            return None
 
-    def add_front_matter_to_file(self, md_path: Path, properties: Dict[str, Any]):
-        """Add YAML front matter to an existing Markdown file."""
+    def add_front_matter(self, content: str, properties: Dict[str, Any]) -> str:
+        """Return Markdown content with YAML front matter prepended."""
         if not self.enable_front_matter or not properties:
-            return
+            return content
 
         try:
-            # Read existing content
-            with open(md_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
             # Check if the title from metadata is generic, and if so, try to extract from content
             metadata_title = properties.get("title", "")
             if self.is_generic_title(metadata_title):
@@ -315,256 +815,194 @@ class DocxConverter:
             # Create front matter
             front_matter = self.create_yaml_front_matter(properties)
 
-            # Write back with front matter
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(front_matter + content)
+            return front_matter + content
 
         except Exception as e:
-            logger.warning(f"Could not add front matter to {md_path}: {e}")
+            logger.warning(f"Could not add front matter: {e}")
+            return content
 
     def cleanup_empty_media_dirs(self, media_base: Path, doc_stem: str):
         """Remove empty media directories after conversion."""
+        # rmdir() only succeeds on an empty directory, so let the OS do the
+        # existence and emptiness checks instead of stat-ing first
+        media_dir = media_base / doc_stem
         try:
-            media_dir = media_base / doc_stem
-            if media_dir.exists() and media_dir.is_dir():
-                # Check if directory is empty
-                if not any(media_dir.iterdir()):
-                    media_dir.rmdir()
-                    logger.debug(f"Removed empty media directory: {media_dir}")
-
-                    # Also try to remove parent media directory if it becomes empty
-                    if media_base.exists() and media_base.is_dir():
-                        if not any(media_base.iterdir()):
-                            media_base.rmdir()
-                            logger.debug(
-                                f"Removed empty parent media directory: {media_base}"
-                            )
-        except Exception as e:
-            logger.debug(f"Could not cleanup media directories: {e}")
+            media_dir.rmdir()
+        except OSError as e:
+            if e.errno not in (errno.ENOTEMPTY, errno.EEXIST, errno.ENOENT):
+                logger.debug(f"Could not cleanup media directories: {e}")
+            return
+        logger.debug(f"Removed empty media directory: {media_dir}")
 
-    def apply_markdown_linting_rules(self, md_path: Path):
-        """Apply markdown linting rules as specified in copilot.md."""
+        # Also try to remove parent media directory if it becomes empty. Once
+        # it holds another document's media it stays that way for the batch.
+        if media_base in self._nonempty_media_dirs:
+            return
         try:
-            with open(md_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            media_base.rmdir()
+        except OSError as e:
+            if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+                self._nonempty_media_dirs.add(media_base)
+            elif e.errno != errno.ENOENT:
+                logger.debug(f"Could not cleanup media directories: {e}")
+            return
+        logger.debug(f"Removed empty parent media directory: {media_base}")
+
+    def apply_markdown_linting_rules(self, content: str) -> str:
+        """Apply markdown linting rules as specified in copilot.md."""
+        return "".join(self._iter_linted_markdown(content))
 
-            # Apply the required markdown rules
-            cleaned_content = self._clean_markdown_content(content)
+    def _iter_linted_markdown(self, content: str) -> Iterator[str]:
+        """Apply markdown linting rules, returning the result in pieces.
 
-            # Fix TOC links
-            cleaned_content = self._fix_toc_links(cleaned_content)
+        The last pass is not joined into one string, so the result can be
+        streamed to disk. Content is returned unchanged if linting fails.
+        """
+        try:
+            # Apply the markdown rules
+            linted = self._clean_markdown_content(content)
 
-            # Fix sequential numbering
-            cleaned_content = self._fix_sequential_numbering(cleaned_content)
+            # Fix TOC links to use proper anchors
+            linted = self._fix_toc_links(linted)
 
-            # Write back the cleaned content
-            with open(md_path, "w", encoding="utf-8") as f:
-                f.write(cleaned_content)
+            # Fix sequential numbering for flattened headers
+            return self._iter_sequential_numbering(linted)
 
         except Exception as e:
-            logger.debug(f"Could not apply markdown linting rules to {md_path}: {e}")
+            logger.debug(f"Could not apply markdown linting rules: {e}")
+            return iter((content,))
 
     def _clean_markdown_content(self, content: str) -> str:
         """Clean markdown content according to linting rules."""
-        lines = content.split("\n")
-        cleaned_lines = []
-        i = 0
-
-        while i < len(lines):
-            line = lines[i]
-
-            # MD022: Surround headings with blank lines
-            if line.strip().startswith("#"):
-                # Add blank line before heading (if not already there and not at start)
-                if (
-                    cleaned_lines
-                    and cleaned_lines[-1].strip() != ""
-                    and not cleaned_lines[-1].strip().startswith("#")
-                ):
-                    cleaned_lines.append("")
-
-                cleaned_lines.append(line)
-
-                # Add blank line after heading (if next line isn't blank and exists)
-                if (
-                    i + 1 < len(lines)
-                    and lines[i + 1].strip() != ""
-                    and not lines[i + 1].strip().startswith("#")
-                ):
-                    cleaned_lines.append("")
-
-            # MD032: Surround lists with blank lines
-            elif self._is_list_item(line):
-                # Add blank line before list (if not already there)
-                if (
-                    cleaned_lines
-                    and cleaned_lines[-1].strip() != ""
-                    and not self._is_list_item(cleaned_lines[-1])
-                ):
-                    cleaned_lines.append("")
-
-                # Add all consecutive list items
-                while i < len(lines) and (
-                    self._is_list_item(lines[i]) or lines[i].strip() == ""
-                ):
-                    cleaned_lines.append(lines[i])
-                    i += 1
-                i -= 1  # Adjust for the increment at end of loop
-
-                # Add blank line after list (if next line exists and isn't blank)
-                if (
-                    i + 1 < len(lines)
-                    and lines[i + 1].strip() != ""
-                    and not self._is_list_item(lines[i + 1])
-                ):
-                    cleaned_lines.append("")
-
-            else:
-                cleaned_lines.append(line)
-
-            i += 1
-
-        # MD047: End file with single newline character
-        result = "\n".join(cleaned_lines)
+        # MD022/MD032: Surround headings and lists with blank lines. The
+        # regex engine classifies the lines, so there is no Python loop.
+        result = _BLANK_LINE_NEEDED_RE.sub("\\g<0>\n", content)
 
         # MD012: Remove multiple consecutive blank lines
         # Replace 2 or more consecutive blank lines with exactly 1 blank line
-        result = re.sub(r"\n\s*\n\s*\n+", "\n\n", result)
-
-        # Remove any trailing whitespace/newlines and add single newline
-        result = result.rstrip() + "\n"
+        result = _MULTI_BLANK_RE.sub("\n\n", result)
 
-        return result
+        # MD047: End file with single newline character
+        return result.rstrip() + "\n"
 
     def _is_list_item(self, line: str) -> bool:
         """Check if a line is a list item."""
-        stripped = line.strip()
-        if not stripped:
-            return False
-
-        # Unordered lists: -, *, +
-        if stripped.startswith(("- ", "* ", "+ ")):
-            return True
-
-        # Ordered lists: number followed by . or )
-        import re
-
-        if re.match(r"^\d+[\.\)] ", stripped):
-            return True
-
-        return False
+        # The same compiled pattern the cleanup pass applies to whole documents
+        return _LIST_LINE_RE.match(line) is not None
 
     def _create_heading_anchor(self, heading_text: str) -> str:
         """Create a proper markdown anchor from heading text."""
-        # Remove markdown formatting and extra whitespace
-        clean_text = re.sub(r"[#*_`]", "", heading_text).strip()
-
-        # Convert to lowercase
-        anchor = clean_text.lower()
-
-        # Replace spaces and special characters with hyphens
-        anchor = re.sub(r"[^\w\s-]", "", anchor)
-        anchor = re.sub(r"[-\s]+", "-", anchor)
-
-        # Remove leading/trailing hyphens
-        anchor = anchor.strip("-")
-
-        return anchor
+        return _heading_anchor(heading_text)
+
+    def _record_heading(self, headings: Dict[str, str], stripped: str) -> None:
+        """Record the anchor for a stripped heading line."""
+        heading_text = stripped.lstrip("#").lstrip()
+        anchor = self._create_heading_anchor(heading_text)
+        # Store both the original heading text and variations for matching
+        headings[heading_text] = anchor
+        # Also store simplified versions for better matching
+        simplified = _NUM_TAIL_RE.sub("", heading_text)  # Remove trailing numbers
+        headings[simplified] = anchor
 
     def _fix_toc_links(self, content: str) -> str:
         """Fix table of contents links to use proper markdown anchors."""
-        lines = content.split("\n")
-
-        # First pass: collect all headings and their anchors
-        headings = {}
-        for line in lines:
-            if line.strip().startswith("#"):
-                heading_text = re.sub(r"^#+\s*", "", line.strip())
-                anchor = self._create_heading_anchor(heading_text)
-                # Store both the original heading text and variations for matching
-                headings[heading_text] = anchor
-                # Also store simplified versions for better matching
-                simplified = re.sub(
-                    r"\s+\d+$", "", heading_text
-                )  # Remove trailing numbers
-                headings[simplified] = anchor
-
-        # Second pass: fix TOC links
-        fixed_lines = []
-        for line in lines:
-            # Look for TOC-style links: [text](#_Toc123456)
-            toc_pattern = r"\[([^\]]+)\]\(#_Toc\d+\)"
-
-            def replace_toc_link(match):
-                link_text = match.group(1)
-
-                # Extract the heading text from the link text
-                # Remove numbering at the start and page numbers at the end
-                clean_heading = re.sub(
-                    r"^\d+\.?\s*", "", link_text
-                )  # Remove leading numbers
-                clean_heading = re.sub(
-                    r"\s+\d+$", "", clean_heading
-                )  # Remove trailing page numbers
-                clean_heading = clean_heading.strip()
-
+        # Cheap literal scan first: most documents have no Word TOC links
+        if "(#_Toc" not in content:
+            return content
+
+        # Index all headings and their anchors in one regex pass, so each
+        # link below is a dictionary lookup instead of a document scan
+        headings: Dict[str, str] = {}
+        for match in _HEADING_LINE_RE.finditer(content):
+            self._record_heading(headings, match.group(1).rstrip())
+
+        return self._replace_toc_links(content, headings)
+
+    def _replace_toc_links(self, content: str, headings: Dict[str, str]) -> str:
+        """Replace TOC links like [text](#_Toc123456) with heading anchors."""
+        # Lowercased headings for partial matching, built on the first miss
+        lowered_headings: Optional[List[Tuple[str, str]]] = None
+        resolved: Dict[str, Optional[str]] = {}
+        parts = []
+        position = 0
+
+        for match in _TOC_RE.finditer(content):
+            link_text = match.group(1)
+            parts.append(content[position : match.start()])
+            position = match.end()
+
+            # Extract the heading text from the link text
+            # Remove numbering at the start and page numbers at the end
+            clean_heading = _NUM_LEAD_RE.sub("", link_text)  # Remove leading numbers
+            clean_heading = _NUM_TAIL_RE.sub(
+                "", clean_heading
+            )  # Remove trailing page numbers
+            clean_heading = clean_heading.strip()
+
+            if clean_heading in resolved:
+                anchor = resolved[clean_heading]
+            else:
                 # Find matching heading
-                if clean_heading in headings:
-                    anchor = headings[clean_heading]
-                    return f"[{link_text}](#{anchor})"
+                anchor = headings.get(clean_heading)
 
                 # Try partial matching
-                for heading_text, anchor in headings.items():
-                    if (
-                        clean_heading.lower() in heading_text.lower()
-                        or heading_text.lower() in clean_heading.lower()
-                    ):
-                        return f"[{link_text}](#{anchor})"
-
+                if anchor is None:
+                    if lowered_headings is None:
+                        lowered_headings = [
+                            (heading_text.lower(), heading_anchor)
+                            for heading_text, heading_anchor in headings.items()
+                        ]
+                    clean_lower = clean_heading.lower()
+                    for heading_lower, heading_anchor in lowered_headings:
+                        if clean_lower in heading_lower or heading_lower in clean_lower:
+                            anchor = heading_anchor
+                            break
+
+                resolved[clean_heading] = anchor
+
+            if anchor is not None:
+                parts.append(f"[{link_text}](#{anchor})")
+            else:
                 # If no match found, remove the link but keep the text
-                return link_text
+                parts.append(link_text)
 
-            fixed_line = re.sub(toc_pattern, replace_toc_link, line)
-            fixed_lines.append(fixed_line)
+        if not parts:
+            return content
 
-        return "\n".join(fixed_lines)
+        parts.append(content[position:])
+        return "".join(parts)
 
     def _fix_sequential_numbering(self, content: str) -> str:
         """Fix sequential numbering of headers that got flattened during conversion."""
-        lines = content.split("\n")
-        section_counter = 0
+        return "".join(self._iter_sequential_numbering(content))
+
+    def _iter_sequential_numbering(self, content: str) -> Iterator[str]:
+        """Yield content in pieces with flattened "1. **" sections renumbered."""
+        # Numbered sections always contain bold markers; skip the scan if absent
+        if "**" not in content:
+            yield content
+            return
 
-        for i, line in enumerate(lines):
-            # Look for lines that start with "1. **" (indicating a numbered section)
-            if re.match(r"^\s*1\.\s*\*\*", line.strip()):
-                section_counter += 1
-                # Replace "1." with the correct sequential number
-                lines[i] = re.sub(r"^\s*1\.", f"{section_counter}.", line)
+        position = 0
+        # Look for lines that start with "1. **" (indicating a numbered section)
+        for section_counter, match in enumerate(
+            _SECTION_ONE_RE.finditer(content), start=1
+        ):
+            yield content[position : match.start()]
+            # Replace "1." (and its indentation) with the correct sequential number
+            yield f"{section_counter}."
+            position = match.end()
 
-        return "\n".join(lines)
+        yield content[position:]
 
     def convert_single_file(
         self, docx_path: Path, input_root: Optional[Path] = None
     ) -> bool:
         """Convert a single DOCX file to Markdown."""
         try:
-            # Determine output path
-            if self.output_dir:
-                if self.preserve_structure and input_root:
-                    # Preserve directory structure
-                    rel_path = docx_path.relative_to(input_root)
-                    output_path = self.output_dir / rel_path.with_suffix(".md")
-                else:
-                    # Flat structure
-                    output_path = (
-                        self.output_dir / f"{self.sanitize_filename(docx_path.stem)}.md"
-                    )
-            else:
-                # Same directory as input
-                output_path = docx_path.with_suffix(".md")
-                output_path = output_path.with_name(
-                    self.sanitize_filename(output_path.name)
-                )
+            # Sanitized stem shared by the output name and the media directory
+            doc_stem = self.sanitize_filename(docx_path.stem)
+            output_path = self.get_output_path(docx_path, input_root, doc_stem)
 
             # Check if output already exists
             if output_path.exists() and not self.overwrite:
@@ -581,37 +1019,49 @@ class DocxConverter:
             else:
                 media_base = docx_path.parent / self.media_dir
 
-            # Extract document properties for front matter
-            properties = {}
-            if self.enable_front_matter:
-                properties = self.extract_core_properties(docx_path)
+            # Extract document properties for front matter and check for media
+            # in a single pass over the archive
+            properties, has_media = self.inspect_docx(
+                docx_path, read_properties=self.enable_front_matter
+            )
 
             # Try conversion with Pandoc first (unless strict pure Python)
-            success = False
+            markdown = None
             if not self.strict_pure_python:
-                success = self.convert_with_pandoc(docx_path, output_path, media_base)
+                markdown = self.convert_with_pandoc(
+                    docx_path, media_base, has_media, doc_stem
+                )
 
             # Fall back to Mammoth if Pandoc failed or unavailable
-            if not success:
-                success = self.convert_with_mammoth(docx_path, output_path, media_base)
+            if markdown is None:
+                markdown = self.convert_with_mammoth(
+                    docx_path, media_base, has_media, output_path.parent
+                )
 
-            if success:
+            success = False
+            if markdown is not None:
                 # Add front matter if enabled
                 if self.enable_front_matter and properties:
-                    self.add_front_matter_to_file(output_path, properties)
+                    markdown = self.add_front_matter(markdown, properties)
 
-                # Apply markdown linting rules
-                self.apply_markdown_linting_rules(output_path)
+                # Apply markdown linting rules and stream the result to disk
+                try:
+                    with open(
+                        output_path, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE
+                    ) as md_file:
+                        md_file.writelines(self._iter_linted_markdown(markdown))
+                    success = True
+                except OSError as e:
+                    logger.error(f"Could not write {output_path}: {e}")
 
+            if success:
                 # Clean up empty media directories
-                doc_stem = self.sanitize_filename(docx_path.stem)
                 self.cleanup_empty_media_dirs(media_base, doc_stem)
 
                 self.stats["success"] += 1
                 return True
             else:
                 # Clean up empty media directories even on failure
-                doc_stem = self.sanitize_filename(docx_path.stem)
                 self.cleanup_empty_media_dirs(media_base, doc_stem)
 
                 self.stats["failed"] += 1
@@ -621,40 +1071,93 @@ class DocxConverter:
             self.stats["failed"] += 1
             return False
 
-    def is_temporary_file(self, file_path: Path) -> bool:
-        """Check if a file is a temporary Word file that should be skipped."""
-        filename = file_path.name
+    def get_output_path(
+        self,
+        docx_path: Path,
+        input_root: Optional[Path] = None,
+        doc_stem: Optional[str] = None,
+    ) -> Path:
+        """Return the Markdown path a DOCX file is converted to."""
+        if doc_stem is None:
+            doc_stem = self.sanitize_filename(docx_path.stem)
 
-        # Word temporary files start with ~$
-        if filename.startswith("~$"):
-            return True
+        if self.output_dir:
+            if self.preserve_structure and input_root:
+                # Preserve directory structure
+                rel_path = docx_path.relative_to(input_root)
+                return self.output_dir / rel_path.with_suffix(".md")
+            # Flat structure
+            return self.output_dir / f"{doc_stem}.md"
 
-        # Word lock files start with .~lock.
-        if filename.startswith(".~lock."):
-            return True
+        # Same directory as input
+        return docx_path.with_name(f"{doc_stem}.md")
 
-        # Hidden files (starting with .)
-        if filename.startswith(".") and filename != ".":
-            return True
+    def skip_existing_outputs(
+        self, files: List[Tuple[Path, Optional[Path]]]
+    ) -> List[Tuple[Path, Optional[Path]]]:
+        """Drop files whose Markdown output exists or is claimed, counting them as skipped.
+
+        Files are converted in parallel, so when several inputs map to the
+        same output path (e.g. a flat output tree) only the first one in the
+        batch is kept; the rest are skipped as if its output already existed,
+        instead of racing on the same Markdown file and media directory.
+
+        Each output directory is listed once instead of checking every output
+        path. Only exact name matches are skipped here; anything else is left
+        to the per-file check in convert_single_file.
+        """
+        listings: Dict[Path, Set[str]] = {}
+        claimed: Set[str] = set()
+        remaining = []
+        for docx_path, input_root in files:
+            output_path = self.get_output_path(docx_path, input_root)
+
+            # normcase folds case where the file system does (Windows)
+            output_key = os.path.normcase(output_path)
+            if output_key in claimed:
+                logger.debug(f"Skipping {docx_path}: {output_path} is already claimed")
+                self.stats["skipped"] += 1
+                continue
+            claimed.add(output_key)
+
+            if not self.overwrite:
+                parent = output_path.parent
+                names = listings.get(parent)
+                if names is None:
+                    names = listings[parent] = _list_entry_names(parent)
+                if output_path.name in names:
+                    self.stats["skipped"] += 1
+                    continue
 
-        return False
+            remaining.append((docx_path, input_root))
+
+        return remaining
+
+    def is_temporary_file(self, file_path: Path) -> bool:
+        """Check if a file is a temporary Word file that should be skipped."""
+        filename = file_path.name
+        return filename.startswith(_TEMP_FILE_PREFIXES) and filename != "."
 
     def get_file_skip_reason(self, file_path: Path) -> Optional[str]:
         """Get the reason why a file should be skipped, or None if it shouldn't be."""
-        if self.is_temporary_file(file_path):
-            if file_path.name.startswith("~$"):
-                return "Word temporary/lock file"
-            elif file_path.name.startswith(".~lock."):
-                return "LibreOffice lock file"
-            elif file_path.name.startswith("."):
-                return "hidden file"
+        reason = self._get_name_skip_reason(file_path.name)
+        if reason:
+            return reason
 
-        if file_path.suffix.lower() in [".doc", ".docm"]:
-            return "unsupported format (.doc/.docm)"
+        suffix = file_path.suffix.lower()
+        if suffix != ".docx":
+            return _SKIP_SUFFIX_REASONS.get(suffix, "not a .docx file")
 
-        if file_path.suffix.lower() != ".docx":
-            return "not a .docx file"
+        return None
 
+    def _get_name_skip_reason(self, filename: str) -> Optional[str]:
+        """Get the skip reason implied by a temporary or hidden file name."""
+        # One C-level prefix test rejects ordinary names before the lookup
+        if not filename.startswith(_TEMP_FILE_PREFIXES):
+            return None
+        for prefix, reason in _SKIP_PREFIX_REASONS.items():
+            if filename.startswith(prefix):
+                return reason
         return None
 
     def discover_docx_files(
@@ -675,17 +1178,25 @@ class DocxConverter:
                 else:
                     files.append((input_path, input_path.parent))
             elif input_path.is_dir():
-                pattern = "**/*.docx" if recursive else "*.docx"
-                docx_files = list(input_path.glob(pattern))
-                for docx_file in docx_files:
-                    skip_reason = self.get_file_skip_reason(docx_file)
+                # Names already end in .docx here, so only the prefix can
+                # disqualify them, and Path objects are built for kept files only
+                for entry in _walk_docx(input_path, recursive):
+                    skip_reason = self._get_name_skip_reason(entry.name)
                     if skip_reason:
                         console.print(
-                            f"[yellow]SKIP[/yellow]: {docx_file.name} ([dim]{skip_reason}[/dim])"
+                            f"[yellow]SKIP[/yellow]: {entry.name} ([dim]{skip_reason}[/dim])"
                         )
                         skipped_count += 1
                     else:
-                        files.append((docx_file, input_path))
+                        docx_path = Path(entry.path)
+                        files.append((docx_path, input_path))
+                        # Read the size while the entry is at hand instead of
+                        # stat-ing every path again later; on Windows it comes
+                        # with the directory listing itself
+                        try:
+                            self._docx_sizes[docx_path] = entry.stat().st_size
+                        except OSError:
+                            pass
             else:
                 console.print(f"[red]ERROR[/red]: {input_path} (path not found)")
 
@@ -721,6 +1232,69 @@ class DocxConverter:
             f"\n[green]✓ Found {len(files)} valid .docx file(s) to convert[/green]"
         )
 
+        # Skip up front whatever was already converted by an earlier run
+        pending = self.skip_existing_outputs(files)
+        if len(pending) < len(files):
+            console.print(
+                f"[yellow]⊘ Skipping {len(files) - len(pending)} file(s) with "
+                f"existing or duplicate Markdown output[/yellow]"
+            )
+
+        if pending:
+            # Share one Pandoc server across the batch when possible
+            server = self._start_pandoc_server(len(pending))
+            try:
+                self._convert_all(pending)
+            finally:
+                if server is not None:
+                    server.close()
+                    self.pandoc_server_url = None
+
+        # Print summary table
+        self._print_summary_table()
+
+        # Return appropriate exit code
+        if self.stats["failed"] > 0:
+            return 1
+        return 0
+
+    def _start_pandoc_server(self, file_count: int) -> Optional[PandocServer]:
+        """Start a shared Pandoc server for batches of more than one file, if enabled.
+
+        Opt-in: pandoc server has no bind-address option and listens on all
+        network interfaces for as long as the batch runs.
+        """
+        if not self.use_pandoc_server or self.strict_pure_python or file_count < 2:
+            return None
+
+        pandoc = self.find_pandoc()
+        if not pandoc:
+            return None
+
+        server = PandocServer.start(pandoc)
+        if server is None:
+            # Some Pandoc builds ship the server as a separate executable
+            pandoc_server = shutil.which("pandoc-server")
+            if pandoc_server:
+                server = PandocServer.start(Path(pandoc_server))
+
+        if server is not None:
+            self.pandoc_server_url = server.url
+        return server
+
+    def _convert_all(self, files: List[Tuple[Path, Optional[Path]]]):
+        """Convert discovered files, in parallel when there is more than one."""
+        total = len(files)
+        completed = self._iter_conversions(files)
+
+        # A live progress bar only pays off on an interactive terminal; for
+        # redirected output or very large batches print a line now and then
+        if not console.is_terminal or total > PROGRESS_BAR_FILE_LIMIT:
+            for done, _ in enumerate(completed, start=1):
+                if done % PLAIN_PROGRESS_INTERVAL == 0 or done == total:
+                    console.print(f"[dim]Converted {done}/{total} file(s)[/dim]")
+            return
+
         # Convert each file with progress
         with Progress(
             SpinnerColumn(),
@@ -728,21 +1302,98 @@ class DocxConverter:
             BarColumn(),
             TaskProgressColumn(),
             console=console,
+            transient=True,
+            refresh_per_second=4,
         ) as progress:
-            task = progress.add_task("Converting files...", total=len(files))
+            task = progress.add_task("Converting files...", total=total)
 
-            for docx_path, input_root in files:
-                progress.update(task, description=f"Converting {docx_path.name}")
-                self.convert_single_file(docx_path, input_root)
+            for done, docx_path in enumerate(completed, start=1):
+                # Only refresh the file name periodically to keep rendering cheap
+                if done == 1 or done % PROGRESS_DESCRIPTION_INTERVAL == 0:
+                    progress.update(task, description=f"Converted {docx_path.name}")
                 progress.advance(task)
 
-        # Print summary table
-        self._print_summary_table()
+    def _iter_conversions(
+        self, files: List[Tuple[Path, Optional[Path]]]
+    ) -> Iterator[Path]:
+        """Convert files and yield each path as its conversion completes."""
+        jobs = min(self.jobs or os.cpu_count() or 1, len(files))
+        if jobs == 1:
+            return self._iter_serial_conversions(files)
+
+        # Files are independent, so convert them in parallel. Pandoc does the
+        # heavy lifting in a subprocess (or the shared server) while Python
+        # waits without holding the GIL, so threads are enough; Mammoth is
+        # pure Python and needs worker processes to use more than one core.
+        config = self.worker_config()
+        log_queue = None
+        if not self.strict_pure_python and self.find_pandoc():
+            executor: Executor = ThreadPoolExecutor(max_workers=jobs)
+        else:
+            # Worker processes send log records back through a queue so lines
+            # from different workers are not interleaved
+            log_queue = multiprocessing.Queue()
+            executor = ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_worker_logging,
+                initargs=(log_queue, logging.getLogger().level),
+            )
 
-        # Return appropriate exit code
-        if self.stats["failed"] > 0:
-            return 1
-        return 0
+        # Hand each worker a chunk of files so task dispatch and converter
+        # setup are paid per chunk, while keeping enough chunks per worker
+        # to balance the load
+        chunk_size = max(1, min(WORKER_CHUNK_SIZE, len(files) // (jobs * 4)))
+        futures = {}
+        for chunk in _balanced_chunks(files, chunk_size, self._docx_sizes):
+            future = executor.submit(_convert_chunk_worker, config, chunk)
+            futures[future] = [docx_path for docx_path, _ in chunk]
+
+        # The pool is created and fed above, and the log listener and the
+        # progress display only start their threads afterwards, so worker
+        # processes are never forked from a multi-threaded parent
+        listener = None
+        if log_queue is not None:
+            listener = logging.handlers.QueueListener(
+                log_queue, *logging.getLogger().handlers, respect_handler_level=True
+            )
+            listener.start()
+
+        return self._iter_completed_futures(executor, futures, listener)
+
+    def _iter_serial_conversions(
+        self, files: List[Tuple[Path, Optional[Path]]]
+    ) -> Iterator[Path]:
+        """Convert files in this process, yielding each path when done."""
+        for docx_path, input_root in files:
+            self.convert_single_file(docx_path, input_root)
+            yield docx_path
+
+    def _iter_completed_futures(
+        self,
+        executor: Executor,
+        futures: Dict[Future, List[Path]],
+        listener: Optional[logging.handlers.QueueListener] = None,
+    ) -> Iterator[Path]:
+        """Merge worker statistics, yielding each path as its chunk completes."""
+        try:
+            with executor:
+                for future in as_completed(futures):
+                    chunk = futures[future]
+                    try:
+                        chunk_stats = future.result()
+                    except Exception as e:
+                        logger.error(
+                            f"Worker failed for {', '.join(map(str, chunk))}: {e}"
+                        )
+                        chunk_stats = {"failed": len(chunk)}
+
+                    for key, count in chunk_stats.items():
+                        self.stats[key] += count
+
+                    yield from chunk
+        finally:
+            if listener is not None:
+                listener.stop()
 
     def _print_summary_table(self):
         """Print a formatted summary table using Rich."""
@@ -782,6 +1433,23 @@ class DocxConverter:
         console.print()
 
 
+def _init_worker_logging(log_queue: "multiprocessing.Queue", level: int):
+    """Send a worker process's log records to the parent through a queue."""
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+def _convert_chunk_worker(
+    config: Dict[str, Any], chunk: List[Tuple[Path, Optional[Path]]]
+) -> Dict[str, int]:
+    """Convert a chunk of files in a worker and return their statistics."""
+    converter = DocxConverter(**config)
+    for docx_path, input_root in chunk:
+        converter.convert_single_file(docx_path, input_root)
+    return converter.stats
+
+
 @click.command()
 @click.argument(
     "inputs", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path)
@@ -821,6 +1489,17 @@ class DocxConverter:
     default="title,source_file",
     help="Comma-separated list of front matter fields to include (default: title,source_file). Available: title,author,created,modified,source_file",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Number of files to convert in parallel (default: CPU count)",
+)
+@click.option(
+    "--pandoc-server",
+    is_flag=True,
+    help="Share one Pandoc server process across a batch (listens on all network interfaces while running)",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 def main(
     inputs: Tuple[Path, ...],
@@ -833,6 +1512,8 @@ def main(
     strict_pure_python: bool,
     no_front_matter: bool,
     front_matter_fields: str,
+    jobs: Optional[int],
+    pandoc_server: bool,
     verbose: bool,
 ):
     """Convert DOCX files to Obsidian-friendly Markdown.
@@ -853,6 +1534,12 @@ def main(
         # Force pure Python conversion (skip Pandoc)
         docx2md document.docx --strict-pure-python
 
+        # Limit the number of parallel conversions
+        docx2md input_folder/ -r -o output/ -j 4
+
+        # Share one Pandoc server process instead of one Pandoc run per file
+        docx2md input_folder/ -r -o output/ --pandoc-server
+
         # Customize front matter fields
         docx2md document.docx --front-matter-fields "title,author,created"
 
@@ -879,6 +1566,8 @@ def main(
         strict_pure_python=strict_pure_python,
         enable_front_matter=not no_front_matter,
         front_matter_fields=fields_list,
+        jobs=jobs,
+        use_pandoc_server=pandoc_server,
     )
 
     # Convert files
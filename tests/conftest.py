@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+import docx2md
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Forget cached Pandoc lookups and DOCX reads between tests."""
+    docx2md._locate_pandoc.cache_clear()
+    docx2md._inspect_docx_cached.cache_clear()
+    yield
+    docx2md._locate_pandoc.cache_clear()
+    docx2md._inspect_docx_cached.cache_clear()
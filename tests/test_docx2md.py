@@ -1,12 +1,21 @@
 """Tests for docx2md converter."""
 
+import base64
+import http.server
+import io
+import json
+import mmap
+import os
+import subprocess
 import tempfile
+import threading
 import zipfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
+import docx2md
 from docx2md import DocxConverter
 
 
@@ -22,6 +31,7 @@ class TestDocxConverter:
 
         # Test invalid character removal
         assert converter.sanitize_filename("File<>Name") == "FileName"
+        assert converter.sanitize_filename('a:b"c/d\\e|f?g*h i') == "abcdefgh_i"
 
         # Test case preservation
         assert converter.sanitize_filename("CamelCase") == "CamelCase"
@@ -48,6 +58,17 @@ class TestDocxConverter:
         yaml = converter.create_yaml_front_matter({})
         assert yaml == ""
 
+    def test_is_generic_title(self):
+        """Test detection of placeholder titles."""
+        converter = DocxConverter()
+
+        for title in ["", "  ", "Report v1.2", "Document 3", "Draft notes"]:
+            assert converter.is_generic_title(title)
+        for title in ["Untitled1", "New  Document", "new document template"]:
+            assert converter.is_generic_title(title)
+        for title in ["Quarterly Report", "Reports", "Documentation", "Newsletter"]:
+            assert not converter.is_generic_title(title)
+
     @patch("shutil.which")
     def test_find_pandoc_in_path(self, mock_which):
         """Test finding pandoc in PATH."""
@@ -67,6 +88,15 @@ class TestDocxConverter:
         pandoc_path = converter.find_pandoc()
         assert pandoc_path is None
 
+    @patch("shutil.which")
+    def test_find_pandoc_cached(self, mock_which):
+        """Test that the PATH lookup happens once per process."""
+        mock_which.return_value = None
+
+        assert DocxConverter().find_pandoc() is None
+        assert DocxConverter().find_pandoc() is None
+        mock_which.assert_called_once_with("pandoc")
+
     def test_discover_docx_files_single_file(self, tmp_path):
         """Test discovering single DOCX file."""
         # Create test file
@@ -108,6 +138,38 @@ class TestDocxConverter:
         docx_names = {f[0].name for f in files}
         assert docx_names == {"root.docx", "nested.docx"}
 
+    def test_discover_docx_files_recursive_skips_hidden_dirs(self, tmp_path):
+        """Test that recursive discovery does not descend into hidden directories."""
+        hidden = tmp_path / ".obsidian"
+        hidden.mkdir()
+        (hidden / "template.docx").touch()
+        (tmp_path / "note.docx").touch()
+
+        converter = DocxConverter()
+        files = converter.discover_docx_files([tmp_path], recursive=True)
+
+        assert [f[0].name for f in files] == ["note.docx"]
+
+    def test_discover_docx_files_skips_temporary(self, tmp_path):
+        """Test that temporary files and directories named *.docx are skipped."""
+        (tmp_path / "real.docx").touch()
+        (tmp_path / "~$real.docx").touch()
+        (tmp_path / ".~lock.real.docx#").touch()
+        (tmp_path / ".hidden.docx").touch()
+        (tmp_path / "folder.docx").mkdir()
+        (tmp_path / "folder.docx" / "inner.docx").touch()
+
+        converter = DocxConverter()
+        files = converter.discover_docx_files([tmp_path], recursive=True)
+
+        assert {f[0].name for f in files} == {"real.docx", "inner.docx"}
+        assert converter.get_file_skip_reason(tmp_path / "~$real.docx") == (
+            "Word temporary/lock file"
+        )
+        assert converter.get_file_skip_reason(tmp_path / "old.DOC") == (
+            "unsupported format (.doc/.docm)"
+        )
+
     def test_skip_unsupported_formats(self, tmp_path):
         """Test skipping unsupported file formats."""
         (tmp_path / "test.doc").touch()
@@ -149,6 +211,50 @@ def sample_docx(tmp_path):
     return docx_path
 
 
+# A 1x1 transparent PNG
+PNG_PIXEL = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+)
+
+
+def write_image_docx(docx_path):
+    """Write a minimal DOCX whose body is one inline image."""
+    with zipfile.ZipFile(docx_path, "w") as docx_zip:
+        docx_zip.writestr(
+            "[Content_Types].xml",
+            '<?xml version="1.0"?><Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="png" ContentType="image/png"/>'
+            '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            "</Types>",
+        )
+        docx_zip.writestr(
+            "_rels/.rels",
+            '<?xml version="1.0"?><Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+            "</Relationships>",
+        )
+        docx_zip.writestr(
+            "word/_rels/document.xml.rels",
+            '<?xml version="1.0"?><Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rIdImg" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image" Target="media/image1.png"/>'
+            "</Relationships>",
+        )
+        docx_zip.writestr(
+            "word/document.xml",
+            '<?xml version="1.0"?><w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+            ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+            ' xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"'
+            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+            ' xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+            '<w:body><w:p><w:r><w:drawing><wp:inline><wp:docPr id="1" name="Logo" descr="logo"/>'
+            '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+            '<pic:pic><pic:blipFill><a:blip r:embed="rIdImg"/></pic:blipFill></pic:pic>'
+            "</a:graphicData></a:graphic></wp:inline></w:drawing></w:r></w:p></w:body></w:document>",
+        )
+        docx_zip.writestr("word/media/image1.png", PNG_PIXEL)
+
+
 class TestIntegration:
     """Integration tests."""
 
@@ -163,6 +269,94 @@ class TestIntegration:
         assert properties["modified"] == "2024-01-02T00:00:00Z"
         assert properties["source_file"] == "sample.docx"
 
+    def test_extract_core_properties_malformed_xml(self, tmp_path):
+        """Test that malformed core.xml falls back to source_file only."""
+        docx_path = tmp_path / "broken.docx"
+        with zipfile.ZipFile(docx_path, "w") as docx_zip:
+            docx_zip.writestr("docProps/core.xml", "<cp:coreProperties><dc:title>")
+
+        converter = DocxConverter()
+        properties = converter.extract_core_properties(docx_path)
+
+        assert properties == {"source_file": "broken.docx"}
+
+    @patch("docx2md.lxml_etree", None)
+    def test_extract_core_properties_without_lxml(self, sample_docx, tmp_path):
+        """Test the standard library parser used when lxml is not installed."""
+        converter = DocxConverter()
+        properties = converter.extract_core_properties(sample_docx)
+
+        assert properties["title"] == "Test Document"
+        assert properties["author"] == "Test Author"
+        assert properties["modified"] == "2024-01-02T00:00:00Z"
+
+        docx_path = tmp_path / "broken.docx"
+        with zipfile.ZipFile(docx_path, "w") as docx_zip:
+            docx_zip.writestr("docProps/core.xml", "<cp:coreProperties><dc:title>")
+
+        assert converter.extract_core_properties(docx_path) == {
+            "source_file": "broken.docx"
+        }
+
+    def test_inspect_docx_detects_media(self, sample_docx):
+        """Test that media detection shares the properties read."""
+        converter = DocxConverter()
+
+        properties, has_media = converter.inspect_docx(sample_docx)
+        assert properties["title"] == "Test Document"
+        assert has_media is False
+
+        with zipfile.ZipFile(sample_docx, "a") as docx_zip:
+            docx_zip.writestr("word/media/image1.png", b"png")
+
+        properties, has_media = converter.inspect_docx(
+            sample_docx, read_properties=False
+        )
+        assert properties == {}
+        assert has_media is True
+
+    def test_open_docx_memory_maps(self, sample_docx, tmp_path):
+        """Test that DOCX files are memory-mapped, with a fallback for empty files."""
+        with docx2md._open_docx(sample_docx) as docx_file:
+            assert isinstance(docx_file, mmap.mmap)
+            with zipfile.ZipFile(docx_file) as docx_zip:
+                assert "docProps/core.xml" in docx_zip.namelist()
+
+        empty = tmp_path / "empty.docx"
+        empty.write_bytes(b"")
+        with docx2md._open_docx(empty) as docx_file:
+            assert docx_file.read() == b""
+
+        # Shorter than a zip end record: must fail as a bad zip, not ValueError
+        tiny = tmp_path / "tiny.docx"
+        tiny.write_bytes(b"not a zip")
+        with docx2md._open_docx(tiny) as docx_file:
+            assert not isinstance(docx_file, mmap.mmap)
+            with pytest.raises(zipfile.BadZipFile):
+                zipfile.ZipFile(docx_file)
+
+        converter = DocxConverter()
+        assert converter.extract_core_properties(empty) == {"source_file": "empty.docx"}
+        assert converter.extract_core_properties(tiny) == {"source_file": "tiny.docx"}
+
+    def test_inspect_docx_cached_until_file_changes(self, sample_docx):
+        """Test that unchanged files are not reopened and results are copies."""
+        converter = DocxConverter()
+
+        with patch("zipfile.ZipFile", wraps=zipfile.ZipFile) as mock_zip:
+            properties, _ = converter.inspect_docx(sample_docx)
+            properties["title"] = "Changed"
+            again, _ = converter.inspect_docx(sample_docx)
+
+            assert mock_zip.call_count == 1
+            assert again["title"] == "Test Document"
+
+            stat = sample_docx.stat()
+            os.utime(sample_docx, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            converter.inspect_docx(sample_docx)
+
+            assert mock_zip.call_count == 2
+
     @patch("mammoth.convert_to_html")
     def test_convert_with_mammoth(self, mock_mammoth, sample_docx, tmp_path):
         """Test conversion using Mammoth."""
@@ -173,18 +367,356 @@ class TestIntegration:
         mock_mammoth.return_value = mock_result
 
         converter = DocxConverter()
-        output_path = tmp_path / "output.md"
         media_base = tmp_path / "media"
 
-        success = converter.convert_with_mammoth(sample_docx, output_path, media_base)
-
-        assert success
-        assert output_path.exists()
+        markdown = converter.convert_with_mammoth(sample_docx, media_base)
 
         # Check content was converted
-        content = output_path.read_text()
-        assert "Test" in content
-        assert "Content" in content
+        assert markdown is not None
+        assert "Test" in markdown
+        assert "Content" in markdown
+
+    def test_save_media_image_deduplicates(self, tmp_path):
+        """Test that identical images from different documents share one file."""
+        media_base = tmp_path / "media"
+        markdown_dir = tmp_path / "notes"
+        markdown_dir.mkdir()
+
+        def image(data):
+            return Mock(open=lambda: io.BytesIO(data), content_type="image/png")
+
+        first = docx2md._save_media_image(media_base, markdown_dir, image(b"logo"))
+        second = docx2md._save_media_image(media_base, markdown_dir, image(b"logo"))
+        other = docx2md._save_media_image(media_base, markdown_dir, image(b"photo"))
+
+        assert first == second
+        assert first["src"].startswith("../media/")
+        assert first["src"].endswith(".png")
+        assert first != other
+        assert sorted(path.name for path in media_base.iterdir()) == sorted(
+            Path(attrs["src"]).name for attrs in (first, other)
+        )
+        assert (markdown_dir / first["src"]).read_bytes() == b"logo"
+
+    def test_mammoth_image_links_resolve_from_markdown(self, tmp_path):
+        """Test that image links work from each Markdown file's own directory."""
+        input_dir = tmp_path / "in"
+        (input_dir / "sub").mkdir(parents=True)
+        write_image_docx(input_dir / "c.docx")
+        write_image_docx(input_dir / "sub" / "b.docx")
+        output_dir = tmp_path / "out"
+
+        converter = DocxConverter(
+            output_dir=output_dir, strict_pure_python=True, jobs=1
+        )
+        assert converter.convert_files([input_dir], recursive=True) == 0
+
+        for markdown_path in (output_dir / "c.md", output_dir / "sub" / "b.md"):
+            content = markdown_path.read_text(encoding="utf-8")
+            link = content.split("![logo](", 1)[1].split(")", 1)[0]
+            assert not Path(link).is_absolute()
+            assert (markdown_path.parent / link).read_bytes() == PNG_PIXEL
+        assert len(list((output_dir / "media").iterdir())) == 1
+
+    @patch("mammoth.convert_to_markdown")
+    @patch("mammoth.convert_to_html")
+    def test_convert_with_mammoth_keeps_html_path(
+        self, mock_html, mock_markdown, sample_docx, tmp_path
+    ):
+        """Test that Mammoth output goes through HTML to keep bold and tables."""
+        mock_html.return_value = Mock(
+            value="<p><strong>1. Scope</strong></p><table><tr><td>Cell</td></tr></table>",
+            messages=[],
+        )
+        converter = DocxConverter()
+
+        markdown = converter.convert_with_mammoth(
+            sample_docx, tmp_path / "media", has_media=False
+        )
+
+        assert "**1. Scope**" in markdown
+        assert "| Cell |" in markdown
+        mock_markdown.assert_not_called()
+
+    @patch("docx2md._request_pandoc_server")
+    @patch("subprocess.run")
+    def test_convert_with_pandoc_server(
+        self, mock_run, mock_request, sample_docx, tmp_path
+    ):
+        """Test that a running Pandoc server is used instead of the CLI."""
+        mock_request.return_value = "# From server\n"
+        converter = DocxConverter(pandoc_server_url="http://127.0.0.1:1/")
+        converter.pandoc_path = sample_docx  # Any existing path will do
+
+        markdown = converter.convert_with_pandoc(
+            sample_docx, tmp_path / "media", has_media=False
+        )
+
+        assert markdown == "# From server\n"
+        mock_request.assert_called_once_with("http://127.0.0.1:1/", sample_docx)
+        mock_run.assert_not_called()
+
+    def test_request_pandoc_server_ignores_proxy(self, sample_docx, monkeypatch):
+        """Test that requests to the local Pandoc server bypass HTTP proxies."""
+        received = []
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                received.append(json.loads(self.rfile.read(length)))
+                body = json.dumps({"output": "# Local\n"}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        # A proxy that refuses connections: going through it would fail
+        monkeypatch.setenv("HTTP_PROXY", "http://127.0.0.1:1")
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        monkeypatch.delenv("no_proxy", raising=False)
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/"
+            output = docx2md._request_pandoc_server(url, sample_docx, timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert output == "# Local\n"
+        assert received[0]["from"] == "docx"
+
+    @patch("subprocess.Popen")
+    def test_pandoc_server_timeout_matches_client(self, mock_popen):
+        """Test that the server allows conversions as long as the client waits."""
+        mock_popen.return_value.poll.return_value = 1
+
+        assert docx2md.PandocServer.start(Path("pandoc")) is None
+
+        cmd = mock_popen.call_args.args[0]
+        assert cmd[:2] == ["pandoc", "server"]
+        assert cmd[cmd.index("--timeout") + 1] == str(docx2md.PANDOC_SERVER_TIMEOUT)
+
+        docx2md.PandocServer.start(Path("/usr/bin/pandoc-server"))
+        assert "server" not in mock_popen.call_args.args[0]
+
+    @patch("docx2md.PandocServer.start")
+    @patch("shutil.which", return_value="/usr/bin/pandoc-server")
+    @patch.object(DocxConverter, "find_pandoc", return_value=Path("/usr/bin/pandoc"))
+    def test_start_pandoc_server_binary_fallback(
+        self, mock_find, mock_which, mock_start
+    ):
+        """Test using a standalone pandoc-server when pandoc has no server."""
+        server = Mock(url="http://127.0.0.1:1/")
+        mock_start.side_effect = [None, server]
+        converter = DocxConverter(use_pandoc_server=True)
+
+        assert converter._start_pandoc_server(2) is server
+        assert converter.pandoc_server_url == "http://127.0.0.1:1/"
+        assert mock_start.call_args_list[1].args == (Path("/usr/bin/pandoc-server"),)
+
+    @patch("docx2md.PandocServer.start")
+    def test_start_pandoc_server_disabled_by_default(self, mock_start):
+        """Test that the shared Pandoc server is only started when requested."""
+        assert DocxConverter()._start_pandoc_server(10) is None
+        assert DocxConverter(use_pandoc_server=False)._start_pandoc_server(10) is None
+        mock_start.assert_not_called()
+
+    @patch("docx2md._request_pandoc_server")
+    @patch("subprocess.run")
+    def test_convert_with_pandoc_server_fallback(
+        self, mock_run, mock_request, sample_docx, tmp_path
+    ):
+        """Test falling back to the Pandoc CLI when the server request fails."""
+        mock_request.side_effect = OSError("connection refused")
+        converter = DocxConverter(pandoc_server_url="http://127.0.0.1:1/")
+        converter.pandoc_path = sample_docx
+
+        def fake_pandoc(cmd, **kwargs):
+            Path(cmd[cmd.index("-o") + 1]).write_text("# From CLI\n", encoding="utf-8")
+            return Mock(stderr="")
+
+        mock_run.side_effect = fake_pandoc
+
+        markdown = converter.convert_with_pandoc(
+            sample_docx, tmp_path / "media", has_media=False
+        )
+
+        assert markdown == "# From CLI\n"
+        mock_run.assert_called_once()
+        assert not any(
+            arg.startswith("--extract-media") for arg in mock_run.call_args[0][0]
+        )
+        assert mock_run.call_args.kwargs["stdout"] == subprocess.DEVNULL
+        assert not (tmp_path / "media").exists()
+
+    def test_cleanup_empty_media_dirs(self, tmp_path):
+        """Test that only empty media directories are removed."""
+        converter = DocxConverter()
+        media_base = tmp_path / "media"
+        (media_base / "empty").mkdir(parents=True)
+        (media_base / "images").mkdir()
+        (media_base / "images" / "image1.png").write_bytes(b"png")
+
+        converter.cleanup_empty_media_dirs(media_base, "images")
+        converter.cleanup_empty_media_dirs(media_base, "empty")
+        converter.cleanup_empty_media_dirs(media_base, "missing")
+
+        assert not (media_base / "empty").exists()
+        assert (media_base / "images" / "image1.png").exists()
+
+        # Parent is removed once it is empty
+        other_base = tmp_path / "other"
+        (other_base / "doc").mkdir(parents=True)
+        converter.cleanup_empty_media_dirs(other_base, "doc")
+        assert not other_base.exists()
+
+    def test_convert_single_file_writes_final_markdown(self, sample_docx, tmp_path):
+        """Test that front matter and linting are applied before the single write."""
+        output_dir = tmp_path / "out"
+        converter = DocxConverter(output_dir=output_dir, strict_pure_python=True)
+
+        assert converter.convert_single_file(sample_docx, sample_docx.parent)
+
+        content = (output_dir / "sample.md").read_text(encoding="utf-8")
+        assert content.startswith("---\ntitle: Test Document\n")
+        assert "Test content" in content
+        assert content.endswith("\n")
+        assert not content.endswith("\n\n")
+        assert not (output_dir / "media").exists()
+
+    def test_convert_files_parallel_stats(self, sample_docx, tmp_path):
+        """Test that stats from parallel workers are aggregated."""
+        second_docx = sample_docx.with_name("second.docx")
+        second_docx.write_bytes(sample_docx.read_bytes())
+        output_dir = tmp_path / "out"
+
+        converter = DocxConverter(output_dir=output_dir, strict_pure_python=True)
+        exit_code = converter.convert_files([sample_docx.parent])
+
+        assert exit_code == 0
+        assert converter.stats == {"success": 2, "skipped": 0, "failed": 0}
+        assert (output_dir / "sample.md").exists()
+        assert (output_dir / "second.md").exists()
+
+    @patch.object(DocxConverter, "convert_single_file")
+    def test_convert_files_skips_existing_outputs(
+        self, mock_convert, sample_docx, tmp_path
+    ):
+        """Test that existing outputs are skipped before any conversion starts."""
+        second_docx = sample_docx.with_name("second.docx")
+        second_docx.write_bytes(sample_docx.read_bytes())
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+        (output_dir / "sample.md").write_text("done\n", encoding="utf-8")
+        (output_dir / "second.md").write_text("done\n", encoding="utf-8")
+
+        converter = DocxConverter(output_dir=output_dir, preserve_structure=False)
+        exit_code = converter.convert_files([sample_docx.parent])
+
+        assert exit_code == 0
+        assert converter.stats == {"success": 0, "skipped": 2, "failed": 0}
+        mock_convert.assert_not_called()
+
+        converter = DocxConverter(output_dir=output_dir, overwrite=True)
+        files = [(sample_docx, None), (second_docx, None)]
+        assert converter.skip_existing_outputs(files) == files
+
+    @pytest.mark.parametrize("overwrite", [False, True])
+    def test_convert_files_duplicate_outputs_first_wins(
+        self, sample_docx, tmp_path, overwrite
+    ):
+        """Test that inputs mapping to one output are not converted concurrently."""
+        first = tmp_path / "a" / "report.docx"
+        second = tmp_path / "b" / "report.docx"
+        first.parent.mkdir()
+        second.parent.mkdir()
+        first.write_bytes(sample_docx.read_bytes())
+        write_image_docx(second)
+        output_dir = tmp_path / "out"
+
+        converter = DocxConverter(
+            output_dir=output_dir,
+            preserve_structure=False,
+            overwrite=overwrite,
+            strict_pure_python=True,
+            jobs=2,
+        )
+        exit_code = converter.convert_files([first, second])
+
+        assert exit_code == 0
+        assert converter.stats == {"success": 1, "skipped": 1, "failed": 0}
+        content = (output_dir / "report.md").read_text(encoding="utf-8")
+        assert "Test content" in content
+        assert "![logo]" not in content
+
+    def test_balanced_chunks_spread_largest_files(self, tmp_path):
+        """Test that the largest files are dealt out one per chunk, biggest first."""
+        files = [(tmp_path / f"f{size}.docx", None) for size in range(1, 11)]
+        sizes = {path: size for (path, _), size in zip(files, range(1, 11))}
+
+        chunks = docx2md._balanced_chunks(files, 3, sizes)
+
+        assert [[path.stem for path, _ in chunk] for chunk in chunks] == [
+            ["f10", "f6", "f2"],
+            ["f9", "f5", "f1"],
+            ["f8", "f4"],
+            ["f7", "f3"],
+        ]
+
+    @patch.object(DocxConverter, "find_pandoc", return_value=Path("pandoc"))
+    def test_parallel_chunks_start_with_largest_files(self, mock_find, tmp_path):
+        """Test the chunks submitted for files found by discovery."""
+        for size in range(1, 25):
+            (tmp_path / f"f{size:02}.docx").write_bytes(b"x" * size)
+        converter = DocxConverter(jobs=2)
+        files = converter.discover_docx_files([tmp_path])
+        submitted = []
+
+        def record_chunk(config, chunk):
+            submitted.append([docx_path.stem for docx_path, _ in chunk])
+            return {"success": len(chunk)}
+
+        with patch("docx2md._convert_chunk_worker", side_effect=record_chunk):
+            list(converter._iter_conversions(files))
+
+        # 24 files on 2 workers make chunks of 3, so 8 chunks of every 8th file
+        assert sorted(submitted, reverse=True) == [
+            [f"f{largest - step:02}" for step in (0, 8, 16)]
+            for largest in range(24, 16, -1)
+        ]
+        assert converter.stats["success"] == 24
+
+    @patch("docx2md.ThreadPoolExecutor")
+    @patch.object(DocxConverter, "_start_pandoc_server", return_value=None)
+    @patch.object(DocxConverter, "convert_with_pandoc", return_value="# Converted\n")
+    @patch.object(DocxConverter, "find_pandoc", return_value=Path("pandoc"))
+    def test_convert_files_pandoc_uses_threads(
+        self, mock_find, mock_convert, mock_server, mock_pool, sample_docx, tmp_path
+    ):
+        """Test that Pandoc batches run in a thread pool limited by jobs."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        mock_pool.side_effect = ThreadPoolExecutor
+        second_docx = sample_docx.with_name("second.docx")
+        second_docx.write_bytes(sample_docx.read_bytes())
+        output_dir = tmp_path / "out"
+
+        converter = DocxConverter(output_dir=output_dir, jobs=2)
+        exit_code = converter.convert_files([sample_docx.parent])
+
+        assert exit_code == 0
+        mock_pool.assert_called_once_with(max_workers=2)
+        assert mock_convert.call_count == 2
+        assert (
+            (output_dir / "second.md")
+            .read_text(encoding="utf-8")
+            .endswith("# Converted\n")
+        )
 
 
 if __name__ == "__main__":
@@ -86,6 +86,18 @@ More text"""
         assert not converter._is_list_item("# Header")
         assert not converter._is_list_item("")
 
+    def test_is_list_item_edge_cases(self):
+        """Test list detection for indentation and bare markers."""
+        converter = DocxConverter()
+
+        assert converter._is_list_item("  - Indented item")
+        assert converter._is_list_item("3) Parenthesised number")
+        assert converter._is_list_item("- Item  ")
+
+        assert not converter._is_list_item("- ")
+        assert not converter._is_list_item("-Item")
+        assert not converter._is_list_item("1.Item")
+
     def test_complex_markdown_cleaning(self):
         """Test comprehensive markdown cleaning."""
         converter = DocxConverter()
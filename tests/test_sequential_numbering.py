@@ -130,3 +130,18 @@ Final content."""
         assert "2. **Second**" in result
         assert "3. **Third**" in result
         assert "3. **Third**" in result
+
+    def test_fix_sequential_numbering_exact_output(self):
+        """Test that only the number and its indentation are rewritten."""
+        converter = DocxConverter()
+
+        content = (
+            "Intro\n\n  1. **First**\n\n1.**Second**\n1. Plain\n\t1.  **Third** tail"
+        )
+
+        result = converter._fix_sequential_numbering(content)
+
+        assert result == (
+            "Intro\n\n1. **First**\n\n2.**Second**\n1. Plain\n3.  **Third** tail"
+        )
+        assert "".join(converter._iter_sequential_numbering(content)) == result
@@ -112,3 +112,20 @@ Some content here."""
         title = converter.extract_title_from_markdown(content)
         assert title == "Document Title"
         assert title == "Document Title"
+
+    def test_extract_title_from_markdown(self):
+        """Test title extraction from the first heading or bold line."""
+        converter = DocxConverter()
+
+        assert converter.extract_title_from_markdown("\n# My Title \nBody") == (
+            "My Title"
+        )
+        assert (
+            converter.extract_title_from_markdown(
+                "**Table of Contents**\n**Real Title**"
+            )
+            == "Real Title"
+        )
+        assert converter.extract_title_from_markdown("**Last Line**") == "Last Line"
+        assert converter.extract_title_from_markdown("plain text\n") is None
+        assert converter.extract_title_from_markdown("") is None
@@ -115,3 +115,55 @@ Some content."""
         assert "#_Toc" not in result
         assert "[Nonexistent Section]" not in result
         assert "[Nonexistent Section]" not in result
+
+    def test_fix_toc_links(self):
+        """Test that Word TOC links point at the matching heading anchors."""
+        converter = DocxConverter()
+        content = (
+            "[1. Introduction 3](#_Toc1)\n"
+            "[scope 4](#_Toc2)\n"
+            "[Missing 5](#_Toc3)\n"
+            "\n"
+            "# Introduction\n"
+            "## Project Scope\n"
+        )
+
+        fixed = converter._fix_toc_links(content)
+
+        assert "[1. Introduction 3](#introduction)" in fixed
+        assert "[scope 4](#project-scope)" in fixed
+        assert "\nMissing 5\n" in fixed
+        assert "_Toc" not in fixed
+
+    def test_fix_toc_links_indented_headings(self):
+        """Test that indented headings are indexed and anchors are shared."""
+        converter = DocxConverter()
+        content = "[Results 7](#_Toc1) and [Results 7](#_Toc2)\n\n  ## **Results**  \n"
+
+        fixed = converter._fix_toc_links(content)
+
+        assert fixed.startswith("[Results 7](#results) and [Results 7](#results)\n")
+        assert converter._create_heading_anchor("**Results**") == "results"
+
+    def test_create_heading_anchor(self):
+        """Test heading anchors for ASCII and Unicode headings."""
+        converter = DocxConverter()
+
+        assert converter._create_heading_anchor("Section 1.1") == "section-11"
+        assert converter._create_heading_anchor("Q&A") == "qa"
+        assert converter._create_heading_anchor(" **Set-up** -- Notes ") == (
+            "set-up-notes"
+        )
+        assert converter._create_heading_anchor("Über © Straße") == "über-straße"
+
+    def test_fix_toc_links_exact_output(self):
+        """Test that text between and around rewritten links is kept intact."""
+        converter = DocxConverter()
+        content = (
+            "See [Intro 2](#_Toc1), [Gone 3](#_Toc2) or [Intro 2](#_Toc3).\n# Intro\n"
+        )
+
+        fixed = converter._fix_toc_links(content)
+
+        assert fixed == "See [Intro 2](#intro), Gone 3 or [Intro 2](#intro).\n# Intro\n"
+        assert converter._fix_toc_links("No links here") == "No links here"